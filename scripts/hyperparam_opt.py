@@ -59,7 +59,10 @@ def perform_randomised_grid_search(
     """
     run_id = str(uuid4().int & (1 << 64) - 1)
     print(f"Performing run {run_id}")
-    training_mols = [Chem.MolFromInchi(i) for i in training_data["inchi"]]
+    # Hydrogens are added once here rather than on every fingerprint call.
+    training_mols = [
+        Chem.AddHs(Chem.MolFromInchi(i)) for i in training_data["inchi"]
+    ]
     param_names = list(param_options.keys())
     random.seed(random_seed)
     # Calculate the total number of parameters sampled
@@ -204,9 +207,12 @@ def main():
 def param_type_conversion(params):
     p = []
     for param in params:
-        if param.replace(".", "", 1).isdigit() or param == "None":
+        # literal_eval decides what parses - unlike the isdigit check
+        # it also handles negative numbers - and anything that does
+        # not parse stays a string.
+        try:
             p.append(literal_eval(param))
-        else:
+        except (ValueError, SyntaxError):
             p.append(param)
     return p
 
@@ -18,7 +18,7 @@ This returns the probability that a molecules belongs to the difficult-to-synthe
 """
 
 from collections import defaultdict
-from functools import partial
+from functools import lru_cache, partial
 from operator import sub
 from pathlib import Path
 from ast import literal_eval
@@ -47,11 +47,15 @@ from matplotlib import pyplot as plt
 from matplotlib import cm
 from matplotlib.collections import LineCollection
 import seaborn as sns
-import json
+import hashlib
+import orjson
 from rdkit import Chem
+from rdkit.Chem import rdFingerprintGenerator
+from joblib import Parallel, delayed
+from multiprocessing import cpu_count
 from tqdm import tqdm
 from sklearn.calibration import CalibratedClassifierCV, calibration_curve
-from copy import copy
+from sklearn.base import clone
 from math import log
 from scipy.stats import sem
 from sklearn.dummy import DummyClassifier
@@ -59,6 +63,18 @@ import random
 from sklearn.linear_model import LogisticRegression
 
 
+@lru_cache(maxsize=8)
+def _morgan_generator(radius, nbits):
+    """Returns a cached Morgan generator for a (radius, nbits) pair.
+
+    Generator setup is not free, so one instance is shared across all
+    fingerprint calls with the same parameters.
+    """
+    return rdFingerprintGenerator.GetMorganGenerator(
+        radius=radius, fpSize=nbits
+    )
+
+
 def get_fingerprint_as_bit_counts(
     mol: AllChem.Mol, return_info=False, nbits=1024, radius=2
 ):
@@ -68,24 +84,266 @@ def get_fingerprint_as_bit_counts(
     Args:
         mol: The RDKit molecule
         to have its fingerprints calculated.
+        Add explicit hydrogens beforehand if they are required - the
+        molecule is fingerprinted as passed.
         return_info: Returns the fingerprint mapping from fragments to bits.
     """
-    info = dict()
-    # Ensure molecules has hydrogens added for consistency.
-    mol = AllChem.AddHs(mol)
-    fp = AllChem.GetMorganFingerprintAsBitVect(
-        mol=mol,
-        radius=radius,
-        nBits=nbits,
-        bitInfo=info,
-    )
-    fp = list(fp)
-    for bit, activators in info.items():
-        fp[bit] = len(activators)
     if return_info:
-        # Return fingerprint mapping, if requested.
+        # Slow path - the fragment mapping is only available through
+        # bitInfo, so the counts are reconstructed from it here.
+        info = dict()
+        fp = AllChem.GetMorganFingerprintAsBitVect(
+            mol=mol,
+            radius=radius,
+            nBits=nbits,
+            bitInfo=info,
+        )
+        fp = list(fp)
+        for bit, activators in info.items():
+            fp[bit] = len(activators)
         return fp, info
-    return fp
+    # The cached generator computes the counts in C++ and hands them
+    # back as an ndarray, with no Python-level conversion.
+    return _morgan_generator(radius, nbits).GetCountFingerprintAsNumPy(mol)
+
+
+def _stack_fingerprints(fingerprints):
+    """Stacks a column of fingerprints into one contiguous matrix.
+
+    Fills a single preallocated buffer rather than materialising a
+    temporary array per molecule.
+
+    Args:
+        fingerprints: Iterable of fingerprints, one per molecule.
+    Returns:
+        np.ndarray: Matrix of fingerprints with shape (N, nbits).
+    """
+    fingerprints = list(fingerprints)
+    # Morgan bit counts are small integers, so uint8 is sufficient and
+    # moves an eighth of the bytes a float64 matrix would.
+    out = np.empty(
+        (len(fingerprints), len(fingerprints[0])), dtype=np.uint8
+    )
+    for i, fp in enumerate(fingerprints):
+        out[i] = fp
+    return out
+
+
+def pack_fingerprints(fps):
+    """Packs fingerprints into presence bits, 8 per byte.
+
+    Only bit presence survives packing, so this suits similarity and
+    feature-index analyses, not the count-based model input. At 1024
+    bits each fingerprint packs into 128 bytes.
+
+    Args:
+        fps: Fingerprint matrix of bit counts with shape (N, nbits).
+    Returns:
+        np.ndarray: Packed matrix with shape (N, nbits // 8).
+    """
+    return np.packbits(np.asarray(fps) > 0, axis=-1)
+
+
+def unpack_fingerprints(packed, nbits=1024):
+    """Unpacks fingerprints packed by :func:`pack_fingerprints`.
+
+    Args:
+        packed: Packed presence-bit matrix.
+        nbits: Number of bits in each original fingerprint.
+    Returns:
+        np.ndarray: Presence-bit matrix with shape (N, nbits).
+    """
+    return np.unpackbits(packed, axis=-1)[..., :nbits]
+
+
+def platt_fit(probs, y, max_iter=100, tol=1e-10):
+    """Fits a two-parameter sigmoid calibrator by Newton's method.
+
+    Implements the Platt scaling fit of Lin et al. (2007), the same
+    procedure CalibratedClassifierCV runs internally, without the
+    estimator wrapper around it. The calibrated probability of the
+    synthesisable class is 1 / (1 + exp(a * p + b)).
+
+    Args:
+        probs: Uncalibrated positive-class probabilities.
+        y: Binary labels for the calibration set.
+    Returns:
+        tuple: The sigmoid parameters (a, b).
+    """
+    probs = np.asarray(probs, dtype=np.float64)
+    y = np.asarray(y)
+    prior1 = np.count_nonzero(y == 1)
+    prior0 = len(y) - prior1
+    # Smoothed targets, per Platt, to avoid saturating the sigmoid.
+    t = np.where(
+        y == 1, (prior1 + 1.0) / (prior1 + 2.0), 1.0 / (prior0 + 2.0)
+    )
+    a = 0.0
+    b = log((prior0 + 1.0) / (prior1 + 1.0))
+
+    def objective(a, b):
+        z = a * probs + b
+        # Cross-entropy against the smoothed targets, evaluated
+        # stably for both signs of z.
+        return np.sum(t * z + np.logaddexp(0.0, -z))
+
+    best = objective(a, b)
+    for _ in range(max_iter):
+        z = a * probs + b
+        p = 1.0 / (1.0 + np.exp(np.clip(z, -500, 500)))
+        grad_a = np.dot(t - p, probs)
+        grad_b = np.sum(t - p)
+        if abs(grad_a) < tol and abs(grad_b) < tol:
+            break
+        weight = p * (1.0 - p)
+        h11 = np.dot(weight, probs * probs) + tol
+        h22 = np.sum(weight) + tol
+        h12 = np.dot(weight, probs)
+        det = h11 * h22 - h12 * h12
+        step_a = -(h22 * grad_a - h12 * grad_b) / det
+        step_b = -(h11 * grad_b - h12 * grad_a) / det
+        # Halve the Newton step until the objective improves.
+        step_size = 1.0
+        while step_size >= 1e-10:
+            new_a = a + step_size * step_a
+            new_b = b + step_size * step_b
+            new_best = objective(new_a, new_b)
+            if new_best < best:
+                a, b, best = new_a, new_b, new_best
+                break
+            step_size /= 2.0
+        else:
+            break
+    return a, b
+
+
+def _unpack_data(data):
+    """Unpacks a dataset into a fingerprint matrix and label vector.
+
+    Args:
+        data: Either a DataFrame with "fingerprint" and "synthesisable"
+        columns, or an (X, y) tuple holding the fingerprint matrix and
+        labels directly.
+    Returns:
+        tuple: The fingerprint matrix and label array.
+    """
+    if isinstance(data, pd.DataFrame):
+        return (
+            _stack_fingerprints(data["fingerprint"]),
+            data["synthesisable"].to_numpy(),
+        )
+    x, y = data
+    return np.asarray(x), np.asarray(y)
+
+
+def _split_into_chunks(items, n_jobs):
+    """Splits a sequence into one contiguous chunk per worker."""
+    processes = cpu_count() if n_jobs == -1 else n_jobs
+    chunk_size = -(-len(items) // processes)
+    return [
+        items[i : i + chunk_size] for i in range(0, len(items), chunk_size)
+    ]
+
+
+def _fingerprint_chunk_from_smiles(smiles, nbits, radius):
+    """Parses and fingerprints a chunk of SMILES strings."""
+    mols = [Chem.AddHs(Chem.MolFromSmiles(s)) for s in smiles]
+    return _fingerprint_chunk(mols, nbits, radius)
+
+
+def _fingerprint_chunk_from_inchis(inchis, nbits, radius):
+    """Parses and fingerprints a chunk of InChI strings.
+
+    Parsing runs inside the worker so it parallelises along with the
+    fingerprinting instead of happening serially beforehand.
+    """
+    mols = [Chem.AddHs(Chem.MolFromInchi(inchi)) for inchi in inchis]
+    return _fingerprint_chunk(mols, nbits, radius)
+
+
+def get_fingerprint_matrix_from_inchis(inchis, nbits=1024, radius=2, n_jobs=-1):
+    """Gets Morgan fingerprint bit counts for a batch of InChI strings.
+
+    Args:
+        inchis: The InChI strings of the molecules to fingerprint.
+        nbits: Number of bits in each fingerprint.
+        radius: Radius of the Morgan fingerprint.
+        n_jobs: Number of processes used to calculate fingerprints.
+    Returns:
+        np.ndarray: Matrix of fingerprints with shape (len(inchis), nbits).
+    """
+    fps = Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(_fingerprint_chunk_from_inchis)(chunk, nbits, radius)
+        for chunk in _split_into_chunks(inchis, n_jobs)
+    )
+    return np.concatenate(fps)
+
+
+def _fingerprint_chunk(mols, nbits, radius):
+    """Calculates count fingerprints for a chunk of molecules.
+
+    A single Morgan generator is shared across the chunk so the
+    generator setup cost is paid once per worker rather than once
+    per molecule.
+    """
+    generator = _morgan_generator(radius, nbits)
+    fps = np.empty((len(mols), nbits), dtype=np.uint8)
+    for i, mol in enumerate(mols):
+        fps[i] = generator.GetCountFingerprint(mol).ToList()
+    return fps
+
+
+def get_fingerprint_matrix(mols, nbits=1024, radius=2, n_jobs=-1):
+    """Gets Morgan fingerprint bit counts for a batch of molecules.
+
+    Fingerprint generation is compute-bound in RDKit, so the molecules
+    are split into one chunk per core and fingerprinted in parallel.
+
+    Args:
+        mols: The RDKit molecules to have their fingerprints calculated.
+        nbits: Number of bits in each fingerprint.
+        radius: Radius of the Morgan fingerprint.
+        n_jobs: Number of processes used to calculate fingerprints.
+    Returns:
+        np.ndarray: Matrix of fingerprints with shape (len(mols), nbits).
+    """
+    fps = Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(_fingerprint_chunk)(chunk, nbits, radius)
+        for chunk in _split_into_chunks(mols, n_jobs)
+    )
+    return np.concatenate(fps)
+
+
+def _train_and_evaluate_fold(model, x, y, train_ind, test_ind, metrics):
+    """Fits a copy of the model on one fold and scores the held-out split.
+
+    Runs inside a joblib worker, so the forest itself is forced to a
+    single job to avoid nesting process pools.
+
+    Args:
+        model: Unfitted classifier to copy for this fold.
+        x: Fingerprint matrix for the full dataset.
+        y: Labels for the full dataset.
+        train_ind: Indices of the training split.
+        test_ind: Indices of the held-out split.
+        metrics: Mapping from metric name to scoring function.
+    Returns:
+        tuple: Scores for each metric, the held-out predictions and
+        the held-out labels.
+    """
+    # Clone rather than copy - a shallow copy of a fitted estimator
+    # shares its internal state between folds.
+    model = clone(model)
+    if getattr(model, "n_jobs", None) is not None:
+        model.n_jobs = 1
+    model.fit(X=x[train_ind], y=y[train_ind])
+    test_predictions = model.predict(x[test_ind])
+    y_test = y[test_ind]
+    scores = {
+        metric: metrics[metric](y_test, test_predictions)
+        for metric in metrics
+    }
+    return scores, test_predictions, y_test
 
 
 class MPScore:
@@ -109,6 +367,8 @@ class MPScore:
             random_state: Seed for random number generator.
             Used during the training procedure and cross-validation process.
         """
+        self.calibration_params = None
+        self._compiled_predictor = None
         if not param_path:
             # Use default parameters
             self._fp_radius = 2
@@ -120,8 +380,7 @@ class MPScore:
                 criterion="gini",
             )
         if param_path:
-            with open(str(param_path)) as f:
-                params = dict(json.load(f))
+            params = dict(orjson.loads(Path(param_path).read_bytes()))
             print(f"Intialising model using params from {param_path}")
             self._fp_radius = params.pop("fp_radius")
             self._fp_bit_length = params.pop("fp_bit_length")
@@ -132,6 +391,9 @@ class MPScore:
                 class_weight="balanced",
                 criterion="gini",
             )
+        # Guard against the radius and bit length being swapped - a
+        # Morgan radius anywhere near the bit length is never intended.
+        assert self._fp_radius <= 6
 
     def restore(
         self,
@@ -140,20 +402,21 @@ class MPScore:
         ),
     ):
         print(f"Restoring parameters from {model_path}")
-        self.model = joblib.load(model_path)
+        restored = joblib.load(model_path)
+        if isinstance(restored, tuple):
+            self.model, self.calibration_params = restored
+        else:
+            self.model = restored
 
     def cross_validate(self, data):
         """
         Args:
             data: SA classification data.
         """
-        x = np.array([np.array(fp) for fp in data["fingerprint"]])
-        y = data["synthesisable"].to_numpy()
+        x, y = _unpack_data(data)
         # Cross-validation is used to approximate the final score of the MPScore.
         cv = KFold(n_splits=5, shuffle=True, random_state=32)
         # Train 5 models using cross-validation.
-        predictions_combined = []
-        y_test_combined = []
         metrics = {
             "Accuracy": accuracy_score,
             "Precision (Difficult-to-synthesise)": partial(
@@ -183,41 +446,36 @@ class MPScore:
             ),
         }
         results = defaultdict(list)
-        for i, (train_ind, test_ind) in enumerate(cv.split(x, y)):
-            x_train, x_test = x[train_ind], x[test_ind]
-            y_train, y_test = y[train_ind], y[test_ind]
-            # Make a copy of the model to avoid re-training after calibration
-            model = copy(self.model)
-            model.fit(X=x_train, y=y_train)
-            # Keep probabilities for the positive outcomes.
-            test_predictions = [i for i in model.predict(x_test)]
+        splits = list(cv.split(x, y))
+        # The folds are independent, so train them in parallel with one
+        # process each rather than one after the other.
+        folds = Parallel(n_jobs=cv.get_n_splits(), backend="loky")(
+            delayed(_train_and_evaluate_fold)(
+                self.model, x, y, train_ind, test_ind, metrics
+            )
+            for train_ind, test_ind in splits
+        )
+        # Every sample is held out in exactly one fold, so the combined
+        # predictions fill preallocated arrays keyed by each fold's
+        # test indices instead of growing Python lists.
+        predictions_combined = np.empty(len(y), dtype=y.dtype)
+        y_test_combined = np.empty(len(y), dtype=y.dtype)
+        for (_, test_ind), (scores, test_predictions, y_test) in zip(
+            splits, folds
+        ):
             for metric in metrics:
-                score = metrics[metric](y_test, test_predictions)
-                results[metric].append(score)
-            predictions_combined.extend(test_predictions)
-            y_test_combined.extend(y_test)
-        fps = 0
-        tps = 0
-        tns = 0
-        fns = 0
-        for i, predicted_y in enumerate(predictions_combined):
-            actual_y = y_test_combined[i]
-            # Positive sample
-            if actual_y == 1:
-                if actual_y == predicted_y:
-                    tps += 1
-                elif actual_y != predicted_y:
-                    fns += 1
-            elif actual_y == 0:
-                if actual_y == predicted_y:
-                    tns += 1
-                elif actual_y != predicted_y:
-                    fps += 1
+                results[metric].append(scores[metric])
+            predictions_combined[test_ind] = test_predictions
+            y_test_combined[test_ind] = y_test
+        cm = confusion_matrix(
+            y_test_combined, predictions_combined, labels=[0, 1]
+        )
+        tns, fps, fns, tps = cm.ravel()
         for metric in results:
             av = np.mean(results[metric])
             std = np.std(results[metric])
             print(f"Score: {metric}     Average: {av}      Std: {std}")
-        print(f"Confusion: {confusion_matrix(y_test_combined, predictions_combined)}")
+        print(f"Confusion: {cm}")
         print(f"Total Predictions: {len(y_test_combined)}")
         print(f"Total False Positives: {fps}")
         print(f"Total False Negatives: {fns}")
@@ -234,9 +492,12 @@ class MPScore:
 
         Args:
             data: Molecules labelled as synthesisable/unsynthesisable.
+            calibrate: If True, the forest is fitted once on a 75% split
+            and the held-out 25% is used to fit the calibrated wrapper,
+            which is then the intended predictor. The forest is only
+            fitted on the full dataset when calibrate is False.
         """
-        X = np.array([np.array(fp) for fp in data["fingerprint"]])
-        y = data["synthesisable"].to_numpy()
+        X, y = _unpack_data(data)
         print(
             f"There are {sum(y)} molecules labelled indeas synthesisable (which has a value of 1)"
         )
@@ -246,14 +507,63 @@ class MPScore:
         if calibrate:
             X_train, X_calib, y_train, y_calib = train_test_split(X, y, random_state=32)
             self.model.fit(X_train, y_train)
-            clf = CalibratedClassifierCV(self.model, cv="prefit", method="sigmoid")
-            clf.fit(X_calib, y_calib)
+            # Fit the two-parameter sigmoid directly on the held-out
+            # probabilities instead of going through the
+            # CalibratedClassifierCV wrapper.
+            calibration_probs = self.model.predict_proba(X_calib)[:, 1]
+            self.calibration_params = platt_fit(calibration_probs, y_calib)
             print("Finished training calibrated model on entire dataset")
-            self.calibrated_model = clf
         else:
             self.model.fit(X, y)
             print("Finished training model on entire dataset")
 
+    def compile_predictor(
+        self, libpath="mpscore_treelite.so", toolchain="gcc"
+    ):
+        """Compiles the trained forest to native code for prediction.
+
+        Treelite turns the generic sklearn tree traversal into
+        straight-line machine code; once compiled, predict_proba uses
+        the native predictor transparently. The sklearn predictor is
+        kept when treelite is not installed.
+
+        Args:
+            libpath: Path the compiled shared library is written to.
+            toolchain: Compiler toolchain used by treelite.
+        """
+        try:
+            import treelite
+            import treelite_runtime
+        except ImportError:
+            print("treelite is not installed - keeping the sklearn predictor")
+            return
+        compiled = treelite.sklearn.import_model(self.model)
+        compiled.export_lib(
+            toolchain=toolchain, libpath=str(libpath), verbose=False
+        )
+        self._compiled_predictor = treelite_runtime.Predictor(str(libpath))
+
+    def grow_forest(self, data, n_estimators):
+        """Grows the fitted forest to a larger number of trees.
+
+        Warm starting builds only the additional trees, so sweeping
+        over forest sizes avoids refitting every size from scratch.
+
+        Args:
+            data: SA classification data.
+            n_estimators: Total number of trees to grow the forest to.
+        """
+        X, y = _unpack_data(data)
+        already_fitted = hasattr(self.model, "estimators_")
+        if already_fitted and n_estimators <= self.model.n_estimators:
+            return
+        self.model.warm_start = already_fitted
+        try:
+            self.model.n_estimators = n_estimators
+            self.model.fit(X, y)
+        finally:
+            self.model.warm_start = False
+
     def load_data(self, data_path):
         """Loads the SA classification dataset.
 
@@ -261,7 +571,9 @@ class MPScore:
             data_path: Path to the JSON file containing data.
         """
         if data_path.endswith(".json"):
-            return pd.read_json(data_path)
+            # orjson parses the molecule records several times faster
+            # than the parser behind pd.read_json.
+            return pd.DataFrame(orjson.loads(Path(data_path).read_bytes()))
 
     def dump(self, dump_path):
         """Dumps the model to a file.
@@ -269,10 +581,8 @@ class MPScore:
         Args:
             dump_path: Path to dump the model to.
         """
-        if self.calibrated_model:
-            calibrated_path = dump_path.split(".")
-            calibrated_path += "_calibrated.json"
-            joblib.dump(self.calibrated_model, dump_path)
+        if self.calibration_params is not None:
+            joblib.dump((self.model, self.calibration_params), dump_path)
         else:
             joblib.dump(self.model, dump_path)
 
@@ -284,8 +594,19 @@ class MPScore:
         Returns:
             int: Prediction from model.
         """
-        fp = np.array(get_fingerprint_as_bit_counts(mol)).reshape(1, -1)
-        return int(self.model.predict(fp))
+        # The fingerprint is already an ndarray, so adding the batch
+        # axis is a zero-copy view.
+        fp = get_fingerprint_as_bit_counts(mol)[np.newaxis, :]
+        # A single row is dominated by joblib dispatch overhead when the
+        # forest predicts with multiple jobs, so force a serial predict.
+        old_n_jobs = getattr(self.model, "n_jobs", None)
+        if old_n_jobs is not None:
+            self.model.n_jobs = 1
+        try:
+            return int(self.model.predict(fp))
+        finally:
+            if old_n_jobs is not None:
+                self.model.n_jobs = old_n_jobs
 
     def get_score_from_smiles(self, smiles, return_probability=True):
         """Gets MPScore from SMILES string of molecule.
@@ -298,6 +619,8 @@ class MPScore:
             If return_probability, returns probability molecule belongs to the difficult-to-synthesise class. This can then be interpreted as a synthetic difficulty score.
         """
         mol = AllChem.MolFromSmiles(smiles)
+        # Ensure molecules has hydrogens added for consistency.
+        mol = AllChem.AddHs(mol)
         if return_probability:
             return self.predict_proba(mol)
         return self.predict(mol)
@@ -309,19 +632,95 @@ class MPScore:
         Returns:
             float: Probability that molecule belongs to the difficult-to-synthesise class. Interpretted as a measure of synthetic accessibility.
         """
-        fp = np.array(
-            get_fingerprint_as_bit_counts(
-                mol, nbits=self._fp_bit_length, radius=self._fp_bit_length
+        fp = get_fingerprint_as_bit_counts(
+            mol, nbits=self._fp_bit_length, radius=self._fp_radius
+        )[np.newaxis, :]
+        if self._compiled_predictor is not None:
+            import treelite_runtime
+
+            dmat = treelite_runtime.DMatrix(fp.astype(np.float32))
+            # Treelite returns the probability of the synthesisable
+            # class for a binary forest.
+            return 1 - float(self._compiled_predictor.predict(dmat))
+        # See predict - serial prediction is faster for a single row.
+        old_n_jobs = getattr(self.model, "n_jobs", None)
+        if old_n_jobs is not None:
+            self.model.n_jobs = 1
+        try:
+            return self.model.predict_proba(fp)[0][0]
+        finally:
+            if old_n_jobs is not None:
+                self.model.n_jobs = old_n_jobs
+
+    def predict_proba_batch(self, mols, n_jobs=-1):
+        """Predict SA of a batch of molecules as probabilities.
+
+        Fingerprints the molecules in parallel and traverses the
+        forest once for the whole batch rather than per molecule.
+
+        Args:
+            mols: Molecules to have SA calculated.
+            n_jobs: Number of processes used to calculate fingerprints.
+        Returns:
+            np.ndarray: Probability that each molecule belongs to the difficult-to-synthesise class.
+        """
+        X = get_fingerprint_matrix(
+            mols,
+            nbits=self._fp_bit_length,
+            radius=self._fp_radius,
+            n_jobs=n_jobs,
+        )
+        return self.model.predict_proba(X)[:, 0]
+
+    def score_smiles_list(self, smiles, n_jobs=-1, batch_size=50000):
+        """Gets MPScores for a list of SMILES strings.
+
+        Fingerprints are computed in parallel and the forest predicts
+        whole batches, so large screening runs avoid the per-molecule
+        overhead of get_score_from_smiles.
+
+        Args:
+            smiles: SMILES strings of the molecules to score.
+            n_jobs: Number of processes used to calculate fingerprints.
+            batch_size: Number of molecules predicted per forest call.
+            Bounds the per-tree probability buffers for very large
+            screening runs.
+        Returns:
+            np.ndarray: Probability that each molecule belongs to the difficult-to-synthesise class.
+        """
+        X = np.concatenate(
+            Parallel(n_jobs=n_jobs, backend="loky")(
+                delayed(_fingerprint_chunk_from_smiles)(
+                    chunk, self._fp_bit_length, self._fp_radius
+                )
+                for chunk in _split_into_chunks(list(smiles), n_jobs)
             )
-        ).reshape(1, -1)
-        return self.model.predict_proba(fp)[0][0]
+        )
+        scores = np.empty(len(X))
+        for start in range(0, len(X), batch_size):
+            batch = X[start : start + batch_size]
+            scores[start : start + len(batch)] = self.model.predict_proba(
+                batch
+            )[:, 0]
+        return scores
+
+    def predict_calibrated_proba(self, mol):
+        """Predict SA of molecule as a calibrated probability.
+
+        Args:
+            mol: Molecule to have SA calculated.
+        Returns:
+            float: Calibrated probability that molecule belongs to the difficult-to-synthesise class.
+        """
+        a, b = self.calibration_params
+        prob = 1 - self.predict_proba(mol)
+        return 1 - 1 / (1 + np.exp(a * prob + b))
 
     def plot_calibration_curve(self, data):
         fig, ax = plt.subplots()
 
         X_train, X_test, y_train, y_test = train_test_split(
-            [np.array(i) for i in data["fingerprint"].to_numpy()],
-            [np.array(i) for i in data["synthesisable"].to_numpy()],
+            *_unpack_data(data),
             random_state=32,
         )
         X_model_train, X_valid, y_model_train, y_valid = train_test_split(
@@ -329,10 +728,8 @@ class MPScore:
         )
         # Fit the uncalibrated random forest model
         self.model.fit(X_model_train, y_model_train)
-        predicted_probs = [
-            self.model.predict_proba(np.array(fp).reshape(1, -1))[0][1]
-            for fp in tqdm(X_test, desc="Uncalibrated random forest predictions")
-        ]
+        # Predict the entire test set in one call rather than per-sample.
+        predicted_probs = self.model.predict_proba(X_test)[:, 1]
         prob_true, prob_pred = calibration_curve(
             y_prob=predicted_probs,
             y_true=y_test,
@@ -349,10 +746,7 @@ class MPScore:
         )
         # Fit calibrated model on validation set
         sigmoid_clf.fit(X_valid, y_valid)
-        sigmoid_pred = [
-            sigmoid_clf.predict_proba(i.reshape(1, -1))[0][1]
-            for i in tqdm(X_test, desc="Sigmoid random forest predictions")
-        ]
+        sigmoid_pred = sigmoid_clf.predict_proba(X_test)[:, 1]
         prob_true, prob_pred = calibration_curve(
             y_prob=sigmoid_pred,
             y_true=y_test,
@@ -373,10 +767,7 @@ class MPScore:
         )
         # Fit calibrated model on validation set
         isotonic_clf.fit(X_valid, y_valid)
-        isotonic_pred = [
-            isotonic_clf.predict_proba(np.array(fp).reshape(1, -1))[0][1]
-            for fp in tqdm(X_test, desc="Isotonic random forest predictions")
-        ]
+        isotonic_pred = isotonic_clf.predict_proba(X_test)[:, 1]
         prob_true, prob_pred = calibration_curve(
             y_prob=isotonic_pred,
             y_true=y_test,
@@ -399,16 +790,18 @@ class MPScore:
         fig.savefig(str(Path("../images/Calibration_Curve.pdf")))
 
     def get_precision_recall_curve_data(self, data, model):
-        X = np.array([np.array(i) for i in data["fingerprint"].to_list()])
-        y = data["synthesisable"].to_numpy()
+        X, y = _unpack_data(data)
         sampled_thresholds = np.linspace(-0.1, 1.0, 100)
         curves = []
         splits = KFold(n_splits=5, shuffle=True, random_state=32)
         for train_idx, test_idx in splits.split(X=X, y=y):
             X_train, X_test = X[train_idx], X[test_idx]
             y_train, y_test = y[train_idx], y[test_idx]
-            model.fit(X_train, y_train)
-            y_probs_test = [_[1] for _ in model.predict_proba(X_test)]
+            # Each fold fits a fresh clone so no state carries over
+            # between folds.
+            fold_model = clone(model)
+            fold_model.fit(X_train, y_train)
+            y_probs_test = fold_model.predict_proba(X_test)[:, 1]
             curves.append(precision_recall_curve(y_test, y_probs_test))
         sampled_precisions = []
         sampled_recalls = []
@@ -432,7 +825,7 @@ class MPScore:
 
     def plot_precision_recall_curve(self, fig, ax, data):
         # MPScore precision-recall data
-        pr_data = self.get_precision_recall_curve_data(data, model=copy(self.model))
+        pr_data = self.get_precision_recall_curve_data(data, model=clone(self.model))
         mpscore_color = list(sns.color_palette())[3]
         ax.errorbar(
             np.mean(pr_data["Recall"], axis=0),
@@ -492,9 +885,13 @@ class MPScore:
             f'AUC for logistic is {auc(np.mean(log_pr_data["Recall"], axis=0), np.mean(log_pr_data["Precision"], axis=0))}'
         )
         mpscore_thresh = round(
-            invert_calibrated_prob(1 - 0.21, self.calibrated_model), 2
+            invert_calibrated_prob(1 - 0.21, self.calibration_params), 2
+        )
+        # Look up the nearest sampled threshold rather than scanning the
+        # list for an exact match of the rounded value.
+        threshold_ind = int(
+            np.argmin(np.abs(np.asarray(pr_data["Threshold"]) - mpscore_thresh))
         )
-        threshold_ind = list(pr_data["Threshold"]).index(mpscore_thresh)
 
         mpscore_pr = list(np.mean(pr_data["Precision"], axis=0))[threshold_ind]
         mpscore_re = list(np.mean(pr_data["Recall"], axis=0))[threshold_ind]
@@ -533,34 +930,23 @@ class MPScore:
         return fig, ax
 
     def plot_feature_importances(self, ax):
-        importances = [[] for _ in range(1024)]
-        for tree in self.model.estimators_:
-            for i, importance in enumerate(tree.feature_importances_):
-                importances[i].append(importance)
-        importances = np.array(importances)
-        importances_mean = np.mean(importances, axis=1)
-        importances_stdev = np.std(importances, axis=1)
-        fp_importances = {str(i): j for i, j in enumerate(importances_mean)}
-        fp_stdevs = list(
-            sorted(
-                importances_stdev,
-                key=lambda x: fp_importances[str(list(importances_stdev).index(x))],
-                reverse=True,
-            )
-        )
-        fp_importances = dict(
-            sorted(fp_importances.items(), key=lambda x: x[1], reverse=True)
+        importances = np.stack(
+            [tree.feature_importances_ for tree in self.model.estimators_]
         )
+        importances_mean = importances.mean(axis=0)
+        importances_stdev = importances.std(axis=0)
+        # Top 20 bits by mean importance, most important first. The
+        # same permutation orders the standard deviations, so each bar
+        # keeps its own error bar.
+        order = np.argsort(-importances_mean)[:20]
         plt.tight_layout()
         palette = list(sns.color_palette("viridis", 20))[13]
-        x = list(fp_importances.keys())[:20]
-        height = list(fp_importances.values())[:20]
         ax.bar(
-            x,
-            height,
+            [str(i) for i in order],
+            importances_mean[order],
             width=0.6,
             color=palette,
-            yerr=fp_stdevs[:20],
+            yerr=importances_stdev[order],
             error_kw={"elinewidth": 1},
         )
         ax.set_ylim([0, 0.06])
@@ -588,35 +974,58 @@ def main():
         Path(__file__).parents[0].joinpath(Path("hyperparameters/optimal_params.json"))
     )
     model = MPScore(param_path=param_path)
-    training_mols = [Chem.MolFromInchi(i) for i in training_data["inchi"]]
-    training_data["fingerprint"] = [
-        get_fingerprint_as_bit_counts(
-            mol, radius=model._fp_radius, nbits=model._fp_bit_length
+    inchis = list(training_data["inchi"])
+    # Cache the fingerprint matrix on disk so re-runs skip the RDKit
+    # pass entirely. The key covers the molecules and the fingerprint
+    # parameters, so a stale cache is never reused.
+    cache_key = hashlib.sha1(
+        (
+            "".join(inchis)
+            + str(model._fp_radius)
+            + str(model._fp_bit_length)
+        ).encode()
+    ).hexdigest()[:12]
+    cache_path = (
+        Path(__file__)
+        .parents[1]
+        .joinpath(f"data/fingerprints_{cache_key}.npy")
+    )
+    if cache_path.exists():
+        print(f"Loading cached fingerprints from {cache_path}")
+        fps = np.load(str(cache_path), mmap_mode="r")
+    else:
+        # InChI parsing and hydrogen addition happen inside the
+        # fingerprint workers, so the whole precompute parallelises.
+        fps = get_fingerprint_matrix_from_inchis(
+            inchis, radius=model._fp_radius, nbits=model._fp_bit_length
         )
-        for mol in training_mols
-    ]
-    model.train_using_entire_dataset(training_data)
+        np.save(str(cache_path), fps)
+    # Keep the fingerprints as one contiguous matrix rather than a
+    # pandas object column of per-molecule lists.
+    dataset = (fps, training_data["synthesisable"].to_numpy())
+    model.train_using_entire_dataset(dataset)
     # full_model_path = Path("../models/mpscore_calibrated.joblib")
     # model.dump(str(full_model_path))
-    # model.cross_validate(training_data)
-    model.plot_figure_5(data=training_data)
-    # model.plot_calibration_curve(data=training_data)
-    # model.get_precision_recall_curve_data(training_data, model=model.model)
+    # model.cross_validate(dataset)
+    model.plot_figure_5(data=dataset)
+    # model.plot_calibration_curve(data=dataset)
+    # model.get_precision_recall_curve_data(dataset, model=model.model)
 
 
-def invert_calibrated_prob(prob, calibrated_model):
-    sigmoid_classifier = calibrated_model.calibrated_classifiers_[0].calibrators[0]
-    a = sigmoid_classifier.a_
-    b = sigmoid_classifier.b_
+def invert_calibrated_prob(prob, calibration_params):
+    a, b = calibration_params
     return (log((1 - prob) / prob) - b) / a
 
 
 def param_type_conversion(params):
     p = []
     for param in params:
-        if param.replace(".", "", 1).isdigit() or param == "None":
+        # literal_eval decides what parses - unlike the isdigit check
+        # it also handles negative numbers - and anything that does
+        # not parse stays a string.
+        try:
             p.append(literal_eval(param))
-        else:
+        except (ValueError, SyntaxError):
             p.append(param)
     return p
 